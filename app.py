@@ -1,14 +1,23 @@
 import os
-import json
 import time
-import hashlib
+import importlib.util
+import shutil
 import subprocess
 import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+from typing import TYPE_CHECKING
+
+import numpy as np
+import orjson
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+# pandas, plotly, altair and pyarrow are imported lazily where they are used, so reruns that
+# render no tables or charts (e.g. the first page load) skip their import cost.
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # =========================
@@ -19,6 +28,31 @@ OUT_DIR = "out_streamlit"
 PLAN_DEFAULT = "fleetbringup/configs/basic.yaml"
 
 SUBSYSTEMS = ["CPU", "MEM", "NIC", "THERMAL", "POWER"]
+MAX_CHART_POINTS = 2000  # longer series are LTTB-downsampled before plotting
+MAX_VIEW_CHARS = 120000  # artifact viewer shows at most this many characters
+TELEMETRY_DTYPES = {
+    "t_sec": np.int32,
+    "cpu_util_pct": np.float32,
+    "mem_used_gb": np.float32,
+    "temp_c": np.float32,
+    "power_w": np.float32,
+}
+# Columns of fleet_snapshot.csv the triage view reads back
+FLEET_CSV_DTYPES = {
+    "server_id": "string",
+    "overall_score": "float32",
+    "cpu_peak_pct": "float32",
+    "temp_peak_c": "float32",
+    "packet_loss_pct": "float32",
+    "ecc_events": "int32",
+    **{sub: "float32" for sub in SUBSYSTEMS},
+}
+TELEMETRY_TITLES = {
+    "cpu_util_pct": "CPU Utilization (%)",
+    "mem_used_gb": "Memory Used (GB)",
+    "temp_c": "Thermal Sensor (°C)",
+    "power_w": "Power Draw (W)",
+}
 
 st.title("FleetBringUp — Server Bring-Up & Validation")
 st.caption("Internal-style bring-up console: validation plans • failure injection • artifact diagnostics • fleet triage")
@@ -28,24 +62,68 @@ st.caption("Internal-style bring-up console: validation plans • failure inject
 # Helpers
 # =========================
 def _stable_seed(*parts: str) -> int:
-    h = hashlib.sha256(("|".join(parts)).encode("utf-8")).hexdigest()
-    return int(h[:8], 16)
+    # Non-cryptographic: only needs to be deterministic and well spread
+    return zlib.crc32("|".join(parts).encode("utf-8"))
 
 def _now_utc():
     return datetime.now(timezone.utc).isoformat()
 
-def _write_json(path: str, obj: dict):
+def _write_json(path: str, obj: dict, pretty: bool = False):
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2)
-
-def _read_json(path: str):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Encode in one shot (numpy arrays included) and issue a single write. Compact by default;
+    # the artifact viewer pretty-prints on read.
+    option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+    data = orjson.dumps(obj, option=option)
+    with open(path, "wb") as f:
+        f.write(data)
+
+# Artifact loaders are cached on (path, mtime): unchanged files are parsed once, not on every rerun
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _load_json(path: str, mtime: float):
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _load_parquet(path: str, mtime: float) -> "pd.DataFrame":
+    import pandas as pd
+
+    return pd.read_parquet(path)
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _load_fleet_csv(path: str, mtime: float) -> "pd.DataFrame":
+    """Read only the triage columns with a fixed schema; Arrow's multi-threaded parser skips type inference."""
+    import pandas as pd
+
+    return pd.read_csv(path, usecols=list(FLEET_CSV_DTYPES), dtype=FLEET_CSV_DTYPES, engine="pyarrow")
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _list_artifacts(dir_path: str, mtime: float) -> list:
+    """Directory listing keyed on the dir mtime, which changes whenever an artifact is added or removed."""
+    return sorted(e.name for e in os.scandir(dir_path) if e.is_file())
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=32)
+def _read_text(path: str, mtime: float, size: int) -> str:
+    """
+    Cached file read; mtime/size are part of the key so edits invalidate it. JSON is pretty-printed.
+    Only the displayed prefix (MAX_VIEW_CHARS) is kept in the cache.
+    """
+    if path.endswith(".json"):
+        with open(path, "rb") as f:
+            raw = f.read()
+        try:
+            text = orjson.dumps(orjson.loads(raw), option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONDecodeError:
+            text = raw.decode("utf-8", errors="ignore")
+        return text[:MAX_VIEW_CHARS]
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read(MAX_VIEW_CHARS)
 
 def _run_cmd(cmd):
-    p = subprocess.run(cmd, capture_output=True, text=True)
-    return p.returncode, p.stdout, p.stderr
+    # Bytes pipes and no shell/env/preexec_fn keep CPython on its posix_spawn fast path instead of
+    # forking this (large) process; close_fds=False is required for that before 3.13 and is safe since
+    # Python-opened fds are non-inheritable. Output is decoded once at the end.
+    p = subprocess.run(cmd, capture_output=True, close_fds=False)
+    return p.returncode, p.stdout.decode("utf-8", "replace"), p.stderr.decode("utf-8", "replace")
 
 def _score_to_status(score: float, warn_at=0.70, fail_at=0.50) -> str:
     if score < fail_at:
@@ -54,12 +132,11 @@ def _score_to_status(score: float, warn_at=0.70, fail_at=0.50) -> str:
         return "WARN"
     return "PASS"
 
-def _status_color(status: str) -> str:
-    if status == "PASS":
-        return "background-color: rgba(46, 204, 113, 0.20);"
-    if status == "WARN":
-        return "background-color: rgba(241, 196, 15, 0.18);"
-    return "background-color: rgba(231, 76, 60, 0.18);"
+# Status cells get a colored marker via a vectorized map instead of a pandas Styler callback
+_STATUS_BADGE = {"PASS": "🟢 PASS", "WARN": "🟡 WARN", "FAIL": "🔴 FAIL"}
+
+def _with_status_badges(df: "pd.DataFrame") -> "pd.DataFrame":
+    return df.assign(status=df["status"].map(_STATUS_BADGE).fillna(df["status"]))
 
 
 # =========================
@@ -105,41 +182,43 @@ def _inject_failures(base: dict, inject: dict) -> dict:
 # =========================
 # Telemetry Generators
 # =========================
-def _generate_single_telemetry(mode: str, server_id: str, seconds: int, base_params: dict):
-    import random
-    rnd = random.Random(_stable_seed(mode, server_id, _now_utc()[:16]))
-
-    ts = list(range(seconds))
-    cpu_base = rnd.uniform(18, 34)
-    mem_base = rnd.uniform(9, 17)      # GB used
-    temp_base = rnd.uniform(44, 56) + base_params["temp_c_boost"]
-    power_base = rnd.uniform(185, 255) + base_params["power_w_boost"]
-
-    # Stress window
-    stress_start = seconds // 3
-    stress_end = (2 * seconds) // 3
-
-    cpu = []
-    mem = []
-    temp = []
-    power = []
-
-    for t in ts:
-        stress = 1.0 if (stress_start <= t <= stress_end) else 0.0
-
-        cpu_val = cpu_base + rnd.uniform(-4, 4) + stress * rnd.uniform(38, 58)
-        mem_val = mem_base + rnd.uniform(-0.7, 0.7) + stress * rnd.uniform(2.8, 6.5)
-        temp_val = temp_base + rnd.uniform(-1.1, 1.1) + stress * rnd.uniform(9, 18)
-        power_val = power_base + rnd.uniform(-9, 9) + stress * rnd.uniform(55, 115)
-
-        cpu.append(max(0, min(100, cpu_val)))
-        mem.append(max(0, mem_val))
-        temp.append(max(0, temp_val))
-        power.append(max(0, power_val))
+def _params_key(params: dict) -> tuple:
+    """Hashable, order-independent cache key for a base-params dict."""
+    return tuple(sorted(params.items()))
+
+# One small series per (server, params, bucket); ttl=60 drops it once its minute is over, and
+# 8 entries cover the servers and injection toggles a user tries within one minute
+@st.cache_data(show_spinner=False, ttl=60, max_entries=8)
+def _generate_single_telemetry(mode: str, server_id: str, seconds: int, base_params: tuple, bucket: str):
+    rng = np.random.default_rng(_stable_seed(mode, server_id, bucket))
+    base_params = dict(base_params)
+
+    ts = np.arange(seconds)
+    cpu_base = rng.uniform(18, 34)
+    mem_base = rng.uniform(9, 17)      # GB used
+    temp_base = rng.uniform(44, 56) + base_params["temp_c_boost"]
+    power_base = rng.uniform(185, 255) + base_params["power_w_boost"]
+
+    # Stress window; deltas are only drawn for the in-window samples
+    stress = slice(seconds // 3, (2 * seconds) // 3 + 1)
+    n_stress = len(ts[stress])
+
+    cpu = cpu_base + rng.uniform(-4, 4, seconds)
+    mem = mem_base + rng.uniform(-0.7, 0.7, seconds)
+    temp = temp_base + rng.uniform(-1.1, 1.1, seconds)
+    power = power_base + rng.uniform(-9, 9, seconds)
+    cpu[stress] += rng.uniform(38, 58, n_stress)
+    mem[stress] += rng.uniform(2.8, 6.5, n_stress)
+    temp[stress] += rng.uniform(9, 18, n_stress)
+    power[stress] += rng.uniform(55, 115, n_stress)
+
+    np.clip(cpu, 0, 100, out=cpu)
+    np.clip(mem, 0, None, out=mem)
+    np.clip(temp, 0, None, out=temp)
+    np.clip(power, 0, None, out=power)
 
     return {
         "meta": {
-            "generated_at_utc": _now_utc(),
             "mode": mode,
             "server_id": server_id,
             "seconds": seconds,
@@ -153,74 +232,134 @@ def _generate_single_telemetry(mode: str, server_id: str, seconds: int, base_par
         }
     }
 
-def _generate_fleet_snapshot(fleet_ids, base_params_by_server: dict):
+def _telemetry_frame(timeseries: dict) -> "pd.DataFrame":
     """
-    Produce per-server summary metrics for fleet triage:
-    - temp_peak, cpu_peak, nic_packet_loss, ecc_events
-    - subsystem scores
+    Build the chart DataFrame from telemetry series with narrow dtypes.
+    The metrics are well within float32 range and t_sec within int32, so each
+    column is cast once here; this halves the frame and the chart payload.
     """
-    rows = []
-    for sid in fleet_ids:
-        bp = base_params_by_server[sid]
-        # generate a short telemetry window to compute peaks
-        tel = _generate_single_telemetry("fleet", sid, seconds=30, base_params=bp)
-        df = pd.DataFrame({
-            "cpu": tel["timeseries"]["cpu_util_pct"],
-            "mem": tel["timeseries"]["mem_used_gb"],
-            "temp": tel["timeseries"]["temp_c"],
-            "power": tel["timeseries"]["power_w"],
-        })
+    import pandas as pd
 
-        cpu_peak = float(df["cpu"].max())
-        mem_peak = float(df["mem"].max())
-        temp_peak = float(df["temp"].max())
-        power_peak = float(df["power"].max())
-
-        pkt_loss = float(bp["packet_loss_pct"])
-        ecc = int(bp["ecc_events"])
-
-        # subsystem scores (0..1). Start from good baseline and degrade by injected params + peaks.
-        cpu_score = 0.95 * bp["cpu_score_mult"]
-        mem_score = 0.95 * bp["mem_score_mult"]
-        nic_score = 0.95 * bp["nic_score_mult"]
-        thermal_score = 0.95 * bp["thermal_score_mult"]
-        power_score = 0.95
-
-        # peak-based degradation (keeps it realistic)
-        if cpu_peak > 95:
-            cpu_score *= 0.82
-        if mem_peak > 24:
-            mem_score *= 0.85
-        if temp_peak > 80:
-            thermal_score *= 0.70
-        if power_peak > 380:
-            power_score *= 0.82
-
-        # pkt loss / ecc degrade further
-        if pkt_loss > 0.8:
-            nic_score *= 0.78
-        if ecc > 6:
-            mem_score *= 0.75
-
-        overall = (cpu_score + mem_score + nic_score + thermal_score + power_score) / 5.0
+    return pd.DataFrame(
+        {col: np.asarray(timeseries[col], dtype=dtype) for col, dtype in TELEMETRY_DTYPES.items()},
+        copy=False,
+    )
 
-        rows.append({
-            "server_id": sid,
-            "cpu_peak_pct": round(cpu_peak, 1),
-            "mem_peak_gb": round(mem_peak, 1),
-            "temp_peak_c": round(temp_peak, 1),
-            "power_peak_w": int(round(power_peak)),
-            "packet_loss_pct": round(pkt_loss, 2),
-            "ecc_events": ecc,
-            "CPU": round(cpu_score, 3),
-            "MEM": round(mem_score, 3),
-            "NIC": round(nic_score, 3),
-            "THERMAL": round(thermal_score, 3),
-            "POWER": round(power_score, 3),
-            "overall_score": round(overall, 3),
-        })
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: indices of n_out points that keep the visual shape of (x, y).
+    First and last points are always kept.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt = edges[i + 2] if i + 2 < n_out - 1 else n
+        avg_x = x[hi:nxt].mean()
+        avg_y = y[hi:nxt].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+def _downsample(df: "pd.DataFrame", y: str, x: str = "t_sec", n_out: int = MAX_CHART_POINTS) -> "pd.DataFrame":
+    """Decimate a series for plotting; short series are returned untouched."""
+    if len(df) <= n_out:
+        return df
+    return df.iloc[_lttb_indices(df[x].to_numpy(), df[y].to_numpy(), n_out)]
+
+def _telemetry_long(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Stack the downsampled metric series into (t_sec, metric, value) rows for one faceted chart."""
+    import pandas as pd
+
+    return pd.concat(
+        [
+            _downsample(df, col)[["t_sec", col]].rename(columns={col: "value"}).assign(metric=title)
+            for col, title in TELEMETRY_TITLES.items()
+        ],
+        ignore_index=True,
+    )
 
-    return pd.DataFrame(rows)
+# A whole-fleet frame is the largest cached value: reruns inside the minute hit, and at most
+# 8 frames (fleet sizes / injection mixes) are held before the oldest is evicted
+@st.cache_data(show_spinner=False, ttl=60, max_entries=8)
+def _generate_fleet_snapshot(fleet_ids: tuple, params: dict, bucket: str, seconds: int = 30):
+    """
+    Produce per-server summary metrics for fleet triage:
+    - temp_peak, cpu_peak, nic_packet_loss, ecc_events
+    - subsystem scores
+    params maps each base-param name to an array aligned with fleet_ids.
+    The whole fleet is simulated at once as (n_servers, seconds) arrays, one per metric.
+    """
+    p = params
+
+    n = len(fleet_ids)
+    shape = (n, seconds)
+    rng = np.random.default_rng([_stable_seed("fleet", sid, bucket) for sid in fleet_ids])
+
+    cpu_base = rng.uniform(18, 34, (n, 1))
+    mem_base = rng.uniform(9, 17, (n, 1))
+    temp_base = rng.uniform(44, 56, (n, 1)) + p["temp_c_boost"][:, None]
+    power_base = rng.uniform(185, 255, (n, 1)) + p["power_w_boost"][:, None]
+
+    # Stress window (same for every server); deltas are only drawn for the in-window columns
+    stress = slice(seconds // 3, (2 * seconds) // 3 + 1)
+    stress_shape = (n, len(range(seconds)[stress]))
+
+    cpu = cpu_base + rng.uniform(-4, 4, shape)
+    mem = mem_base + rng.uniform(-0.7, 0.7, shape)
+    temp = temp_base + rng.uniform(-1.1, 1.1, shape)
+    power = power_base + rng.uniform(-9, 9, shape)
+    cpu[:, stress] += rng.uniform(38, 58, stress_shape)
+    mem[:, stress] += rng.uniform(2.8, 6.5, stress_shape)
+    temp[:, stress] += rng.uniform(9, 18, stress_shape)
+    power[:, stress] += rng.uniform(55, 115, stress_shape)
+
+    cpu_peak = np.clip(cpu.max(axis=1), 0, 100)
+    mem_peak = np.clip(mem.max(axis=1), 0, None)
+    temp_peak = np.clip(temp.max(axis=1), 0, None)
+    power_peak = np.clip(power.max(axis=1), 0, None)
+
+    pkt_loss = p["packet_loss_pct"]
+    ecc = p["ecc_events"].astype(np.int64)
+
+    # subsystem scores (0..1). Start from good baseline and degrade by injected params + peaks,
+    # then pkt loss / ecc degrade further.
+    cpu_score = 0.95 * p["cpu_score_mult"] * np.where(cpu_peak > 95, 0.82, 1.0)
+    mem_score = 0.95 * p["mem_score_mult"] * np.where(mem_peak > 24, 0.85, 1.0) * np.where(ecc > 6, 0.75, 1.0)
+    nic_score = 0.95 * p["nic_score_mult"] * np.where(pkt_loss > 0.8, 0.78, 1.0)
+    thermal_score = 0.95 * p["thermal_score_mult"] * np.where(temp_peak > 80, 0.70, 1.0)
+    power_score = 0.95 * np.where(power_peak > 380, 0.82, 1.0)
+
+    overall = (cpu_score + mem_score + nic_score + thermal_score + power_score) / 5.0
+
+    import pandas as pd
+
+    return pd.DataFrame({
+        "server_id": np.asarray(fleet_ids, dtype=object),
+        "cpu_peak_pct": np.round(cpu_peak, 1),
+        "mem_peak_gb": np.round(mem_peak, 1),
+        "temp_peak_c": np.round(temp_peak, 1),
+        "power_peak_w": np.rint(power_peak).astype(np.int64),
+        "packet_loss_pct": np.round(pkt_loss, 2),
+        "ecc_events": ecc,
+        "CPU": np.round(cpu_score, 3),
+        "MEM": np.round(mem_score, 3),
+        "NIC": np.round(nic_score, 3),
+        "THERMAL": np.round(thermal_score, 3),
+        "POWER": np.round(power_score, 3),
+        "overall_score": np.round(overall, 3),
+    }, copy=False)
 
 
 # =========================
@@ -279,6 +418,8 @@ def _subsystem_summary(server_id: str, injected: dict, fleet_row: dict | None =
             "notes": "meets bring-up acceptance criteria" if status == "PASS" else "requires triage: inspect logs + sensors",
         })
 
+    import pandas as pd
+
     df = pd.DataFrame(rows)
     return df
 
@@ -286,29 +427,96 @@ def _subsystem_summary(server_id: str, injected: dict, fleet_row: dict | None =
 # =========================
 # CLI Runner (best effort)
 # =========================
-def _try_run_cli(mode: str, plan: str, server_id: str, fleet_size: int):
+# Entry points the CLI may be reachable under, in order of preference
+CLI_CANDIDATES = [
+    ("-m", "fleetbringup.main"),
+    ("fleetbringup/main.py",),
+]
+
+def _cli_entrypoint_exists(prefix: tuple) -> bool:
+    """In-process existence check, so we never fork for an entry point that isn't there."""
+    if prefix[0] == "-m":
+        try:
+            return importlib.util.find_spec(prefix[1]) is not None
+        except ModuleNotFoundError:
+            return False
+    return os.path.isfile(prefix[0])
+
+@st.cache_resource(ttl=300, show_spinner=False)
+def _probe_cli(executable: str):
+    """
+    Return the first CLI entry point that answers --help, or None.
+    Negative results are cached too, so a missing CLI costs nothing on later runs.
+    """
+    if shutil.which(executable) is None:
+        return None
+    for prefix in CLI_CANDIDATES:
+        if not _cli_entrypoint_exists(prefix):
+            continue
+        rc, _, _ = _run_cmd([executable, *prefix, "--help"])
+        if rc == 0:
+            return prefix
+    return None
+
+def _can_run_in_process(plan: str) -> bool:
+    """True when the runner package and the plan file are available to this interpreter."""
+    return importlib.util.find_spec("runner") is not None and os.path.isfile(plan)
+
+def _run_in_process(mode: str, plan: str, server_id: str, fleet_size: int):
+    """
+    Run the validation suite through the runner package in this interpreter, skipping a child
+    Python's startup and imports. Returns None when the runner or the plan file isn't available,
+    so the caller falls back to the CLI. Result shape matches _try_run_cli.
     """
-    Best-effort attempt to run the real CLI. If command/args differ, we still proceed with demo artifacts.
+    if not _can_run_in_process(plan):
+        return None
+
+    from pathlib import Path
+
+    from runner.config_loader import ConfigLoader
+    from runner.test_orchestrator import TestOrchestrator
+
+    server_ids = [server_id] if mode == "single" else [f"srv-{i:03d}" for i in range(1, fleet_size + 1)]
+    used_cmd = f"# in-process: TestOrchestrator.run() x{len(server_ids)} --plan {plan} --out {OUT_DIR}"
+    try:
+        test_plan = ConfigLoader(plan).load()
+        out_path = Path(OUT_DIR)
+        out_path.mkdir(exist_ok=True)
+        # The simulated tests mostly sleep, so servers overlap well on threads
+        with ThreadPoolExecutor(max_workers=min(32, len(server_ids))) as pool:
+            statuses = list(pool.map(
+                lambda sid: TestOrchestrator(sid, test_plan, out_path).run()["overall_status"], server_ids
+            ))
+    except Exception as e:
+        return False, used_cmd, "", str(e)
+
+    stdout = "\n".join(f"{sid}: {status}" for sid, status in zip(server_ids, statuses))
+    return all(status == "PASS" for status in statuses), used_cmd, stdout, ""
+
+def _try_run_cli(prefix, mode: str, plan: str, server_id: str, fleet_size: int):
     """
+    Best-effort attempt to run the validation suite, in-process when possible and otherwise via the
+    real CLI. If command/args differ, we still proceed with demo artifacts.
+    prefix is the entry point from _probe_cli (None when no CLI is available, or when none was
+    probed because the run stays in-process). Streamlit-free, so it can run on a worker thread.
+    """
+    result = _run_in_process(mode, plan, server_id, fleet_size)
+    if result is not None:
+        return result
+
     if mode == "single":
-        cmds = [
-            [sys.executable, "-m", "fleetbringup.main", "run", "--plan", plan, "--server-id", server_id, "--out", OUT_DIR],
-            [sys.executable, "fleetbringup/main.py", "run", "--plan", plan, "--server-id", server_id, "--out", OUT_DIR],
-        ]
+        args = ["run", "--plan", plan, "--server-id", server_id, "--out", OUT_DIR]
     else:
-        cmds = [
-            [sys.executable, "-m", "fleetbringup.main", "run-fleet", "--plan", plan, "--fleet-size", str(fleet_size), "--out", OUT_DIR],
-            [sys.executable, "fleetbringup/main.py", "run-fleet", "--plan", plan, "--fleet-size", str(fleet_size), "--out", OUT_DIR],
-        ]
+        args = ["run-fleet", "--plan", plan, "--fleet-size", str(fleet_size), "--out", OUT_DIR]
 
-    for cmd in cmds:
-        rc, out, err = _run_cmd(cmd)
-        if rc == 0:
-            return True, " ".join(cmd), out, err
+    if prefix is None:
+        # fallback
+        last_cmd = " ".join([sys.executable, *CLI_CANDIDATES[-1], *args])
+        return False, last_cmd, "", ""
 
-    # fallback
-    last_cmd = " ".join(cmds[-1])
-    return False, last_cmd, "", ""
+    cmd = [sys.executable, *prefix, *args]
+    rc, out, err = _run_cmd(cmd)
+    return rc == 0, " ".join(cmd), out, err
 
 
 # =========================
@@ -345,6 +553,9 @@ with st.sidebar:
 
     st.caption("These toggles alter telemetry + subsystem pass/fail, and write artifacts for auditability.")
 
+    st.divider()
+    pretty_artifacts = st.toggle("Pretty-print JSON artifacts", value=False)
+
 
 # =========================
 # Run button
@@ -368,17 +579,36 @@ if run:
     }
     base = _inject_failures(base, injected)
 
-    with st.spinner("Running validation…"):
-        cli_ok, used_cmd, stdout, stderr = _try_run_cli(mode, plan, server_id, fleet_size)
+    # Timestamps are taken once per run. Seeds are bucketed per minute so reruns within
+    # the same minute hit the cache.
+    now_iso = _now_utc()
+    bucket = str(int(time.time() // 60))
+
+    with st.spinner("Running validation…"), ThreadPoolExecutor(max_workers=1) as pool:
+        # The CLI runs in the background while the demo telemetry below is generated
+        # Only the subprocess fallback needs an entry point, so the CLI is probed just for that path
+        prefix = None if _can_run_in_process(plan) else _probe_cli(sys.executable)
+        cli_future = pool.submit(_try_run_cli, prefix, mode, plan, server_id, fleet_size)
 
         # Always generate telemetry artifacts & validation summary for the UI
         if mode == "single":
-            tel = _generate_single_telemetry("single", server_id, seconds=60, base_params=base)
-            _write_json(os.path.join(OUT_DIR, "telemetry_timeseries.json"), tel)
+            tel = _generate_single_telemetry("single", server_id, 60, _params_key(base), bucket)
+            tel["meta"]["generated_at_utc"] = now_iso
+            st.session_state["telemetry"] = tel
+            _write_json(os.path.join(OUT_DIR, "telemetry_timeseries.json"), tel, pretty=pretty_artifacts)
+            # Columnar copy for the dashboard: loads straight into arrays, no JSON parse / dict materialization
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            pq.write_table(
+                pa.Table.from_pandas(_telemetry_frame(tel["timeseries"]), preserve_index=False),
+                os.path.join(OUT_DIR, "telemetry_timeseries.parquet"),
+            )
 
             summary_df = _subsystem_summary(server_id, injected)
+            cli_ok, used_cmd, stdout, stderr = cli_future.result()
             summary = {
-                "generated_at_utc": _now_utc(),
+                "generated_at_utc": now_iso,
                 "mode": "single",
                 "server_id": server_id,
                 "plan": plan,
@@ -387,40 +617,50 @@ if run:
                 "cli_attempted_command": used_cmd,
                 "cli_ok": cli_ok,
             }
-            _write_json(os.path.join(OUT_DIR, "validation_summary.json"), summary)
+            _write_json(os.path.join(OUT_DIR, "validation_summary.json"), summary, pretty=pretty_artifacts)
 
         else:
             # Fleet: create deterministic fleet ids
             fleet_ids = [f"srv-{i:03d}" for i in range(1, fleet_size + 1)]
 
-            # Per-server base params with slight random spread; apply injected failures to a subset to look realistic
-            base_params_by_server = {}
-            for sid in fleet_ids:
-                b = dict(base)
-                # spread fleet variability
-                spread = (_stable_seed(sid, _now_utc()[:16]) % 9) - 4  # -4..+4
-                b["temp_c_boost"] += 0.6 * spread
-                b["power_w_boost"] += 2.0 * spread
-                # Make only some servers “hit” by the injected failure to simulate partial fleet impact
-                hit = (_stable_seed("hit", sid, _now_utc()[:16]) % 100)
-                if injected["overheat"] and hit < 30:
-                    b["temp_c_boost"] += 7.5 * injected["overheat_severity"]
-                    b["thermal_score_mult"] *= max(0.35, 1.0 - 0.14 * injected["overheat_severity"])
-                if injected["ecc_error"] and hit < 25:
-                    b["ecc_events"] += int(3 * injected["ecc_severity"] + 2)
-                    b["mem_score_mult"] *= max(0.30, 1.0 - 0.16 * injected["ecc_severity"])
-                if injected["packet_loss"] and hit < 35:
-                    b["packet_loss_pct"] += 0.8 * injected["pktloss_severity"]
-                    b["nic_score_mult"] *= max(0.25, 1.0 - 0.18 * injected["pktloss_severity"])
-
-                base_params_by_server[sid] = b
-
-            fleet_df = _generate_fleet_snapshot(fleet_ids, base_params_by_server)
+            # Per-server base params, stored column-wise (one array per param), with slight random
+            # spread; apply injected failures to a subset to look realistic
+            n = len(fleet_ids)
+            setup_rng = np.random.default_rng(_stable_seed("fleet-setup", bucket))
+            spread = setup_rng.integers(-4, 5, n)  # -4..+4
+            # Make only some servers “hit” by the injected failure to simulate partial fleet impact
+            hit = setup_rng.integers(0, 100, n)
+
+            params = {k: np.full(n, float(v)) for k, v in base.items()}
+            params["temp_c_boost"] += 0.6 * spread
+            params["power_w_boost"] += 2.0 * spread
+            if injected["overheat"]:
+                sev = injected["overheat_severity"]
+                m = hit < 30
+                params["temp_c_boost"][m] += 7.5 * sev
+                params["thermal_score_mult"][m] *= max(0.35, 1.0 - 0.14 * sev)
+            if injected["ecc_error"]:
+                sev = injected["ecc_severity"]
+                m = hit < 25
+                params["ecc_events"][m] += int(3 * sev + 2)
+                params["mem_score_mult"][m] *= max(0.30, 1.0 - 0.16 * sev)
+            if injected["packet_loss"]:
+                sev = injected["pktloss_severity"]
+                m = hit < 35
+                params["packet_loss_pct"][m] += 0.8 * sev
+                params["nic_score_mult"][m] *= max(0.25, 1.0 - 0.18 * sev)
+
+            fleet_df = _generate_fleet_snapshot(tuple(fleet_ids), params, bucket)
 
             # Save artifacts
-            fleet_df.to_csv(os.path.join(OUT_DIR, "fleet_snapshot.csv"), index=False)
+            # Arrow's C++ CSV writer; the snapshot columns are already NumPy-backed
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+
+            pacsv.write_csv(pa.Table.from_pandas(fleet_df, preserve_index=False), os.path.join(OUT_DIR, "fleet_snapshot.csv"))
+            cli_ok, used_cmd, stdout, stderr = cli_future.result()
             _write_json(os.path.join(OUT_DIR, "fleet_snapshot.json"), {
-                "generated_at_utc": _now_utc(),
+                "generated_at_utc": now_iso,
                 "mode": "fleet",
                 "plan": plan,
                 "fleet_size": fleet_size,
@@ -428,26 +668,26 @@ if run:
                 "rows": fleet_df.to_dict(orient="records"),
                 "cli_attempted_command": used_cmd,
                 "cli_ok": cli_ok,
-            })
+            }, pretty=pretty_artifacts)
 
             # Derive offenders list (lowest overall score)
-            offenders = fleet_df.sort_values("overall_score", ascending=True).head(10)
+            offenders = fleet_df.nsmallest(10, "overall_score")
             _write_json(os.path.join(OUT_DIR, "top_offenders.json"), {
-                "generated_at_utc": _now_utc(),
+                "generated_at_utc": now_iso,
                 "top_offenders": offenders[["server_id", "overall_score", "temp_peak_c", "packet_loss_pct", "ecc_events"]].to_dict(orient="records")
-            })
+            }, pretty=pretty_artifacts)
 
         # Fallback proof when CLI doesn't match
         if not cli_ok:
             _write_json(os.path.join(OUT_DIR, "DEMO_PROOF.json"), {
-                "timestamp_utc": datetime.utcnow().isoformat(),
+                "timestamp_utc": now_iso,
                 "mode": mode,
                 "server_id": server_id,
                 "fleet_size": fleet_size,
                 "note": "Validation completed (fallback proof generated). CLI executed via Streamlit demo",
                 "attempted_command": used_cmd,
                 "injected_failures": injected,
-            })
+            }, pretty=pretty_artifacts)
 
         time.sleep(0.25)
 
@@ -477,11 +717,12 @@ with col1:
     # Single mode summary
     summary_path = os.path.join(OUT_DIR, "validation_summary.json")
     if os.path.isfile(summary_path):
-        summary = _read_json(summary_path)
+        import pandas as pd
+
+        summary = _load_json(summary_path, os.path.getmtime(summary_path))
         df = pd.DataFrame(summary["subsystem_summary"])
         st.caption(f"Server: {summary.get('server_id')} • Plan: {summary.get('plan')} • Generated: {summary.get('generated_at_utc')}")
-        styled = df.style.applymap(_status_color, subset=["status"])
-        st.dataframe(styled, use_container_width=True, hide_index=True)
+        st.dataframe(_with_status_badges(df), use_container_width=True, hide_index=True)
     else:
         st.info("Run validation to generate subsystem pass/fail summary.")
 
@@ -500,27 +741,41 @@ with col2:
 st.divider()
 st.subheader("Telemetry Charts (CPU / Memory / Thermal / Power)")
 
+# Prefer the in-memory telemetry from this session's run; disk is only the fallback
+# (e.g. a fresh session with artifacts from an earlier one), columnar Parquet first.
 telemetry_path = os.path.join(OUT_DIR, "telemetry_timeseries.json")
-if os.path.isfile(telemetry_path):
-    tel = _read_json(telemetry_path)
-    df = pd.DataFrame({
-        "t_sec": tel["timeseries"]["t_sec"],
-        "cpu_util_pct": tel["timeseries"]["cpu_util_pct"],
-        "mem_used_gb": tel["timeseries"]["mem_used_gb"],
-        "temp_c": tel["timeseries"]["temp_c"],
-        "power_w": tel["timeseries"]["power_w"],
-    })
-
+telemetry_parquet = os.path.join(OUT_DIR, "telemetry_timeseries.parquet")
+df = None
+tel = st.session_state.get("telemetry")
+if tel is not None:
+    df = _telemetry_frame(tel["timeseries"])
+elif os.path.isfile(telemetry_parquet):
+    df = _load_parquet(telemetry_parquet, os.path.getmtime(telemetry_parquet))
+elif os.path.isfile(telemetry_path):
+    df = _telemetry_frame(_load_json(telemetry_path, os.path.getmtime(telemetry_path))["timeseries"])
+if df is not None:
+
+    # One reduction over the float32 metric block instead of four column scans
+    peaks = df[list(TELEMETRY_TITLES)].max()
     m1, m2, m3, m4 = st.columns(4)
-    m1.metric("CPU peak", f"{df['cpu_util_pct'].max():.1f}%")
-    m2.metric("Mem peak", f"{df['mem_used_gb'].max():.1f} GB")
-    m3.metric("Thermal peak", f"{df['temp_c'].max():.1f} °C")
-    m4.metric("Power peak", f"{df['power_w'].max():.0f} W")
-
-    st.plotly_chart(px.line(df, x="t_sec", y="cpu_util_pct", title="CPU Utilization (%)"), use_container_width=True)
-    st.plotly_chart(px.line(df, x="t_sec", y="mem_used_gb", title="Memory Used (GB)"), use_container_width=True)
-    st.plotly_chart(px.line(df, x="t_sec", y="temp_c", title="Thermal Sensor (°C)"), use_container_width=True)
-    st.plotly_chart(px.line(df, x="t_sec", y="power_w", title="Power Draw (W)"), use_container_width=True)
+    m1.metric("CPU peak", f"{peaks['cpu_util_pct']:.1f}%")
+    m2.metric("Mem peak", f"{peaks['mem_used_gb']:.1f} GB")
+    m3.metric("Thermal peak", f"{peaks['temp_c']:.1f} °C")
+    m4.metric("Power peak", f"{peaks['power_w']:.0f} W")
+
+    # One faceted Vega-Lite chart (Altair ships with Streamlit): a single render pass
+    # instead of four, with the y-axes left independent since units differ per row
+    import altair as alt
+
+    chart = (
+        alt.Chart(_telemetry_long(df))
+        .mark_line()
+        .encode(x=alt.X("t_sec:Q", title="t (s)"), y=alt.Y("value:Q", title=None))
+        .properties(height=180)
+        .facet(row=alt.Row("metric:N", title=None, sort=list(TELEMETRY_TITLES.values())))
+        .resolve_scale(y="independent")
+    )
+    st.altair_chart(chart, use_container_width=True)
 else:
     st.info("Telemetry charts appear after a validation run (single mode).")
 
@@ -530,28 +785,33 @@ st.subheader("Fleet Triage (heatmap + top offenders)")
 
 fleet_csv = os.path.join(OUT_DIR, "fleet_snapshot.csv")
 if os.path.isfile(fleet_csv):
-    fleet_df = pd.read_csv(fleet_csv)
+    import plotly.graph_objects as go
+
+    fleet_df = _load_fleet_csv(fleet_csv, os.path.getmtime(fleet_csv))
 
     # Heatmap across subsystems for top N offenders
     top_n = 20 if len(fleet_df) >= 20 else len(fleet_df)
-    offenders = fleet_df.sort_values("overall_score", ascending=True).head(top_n)
-
-    heat = offenders[["server_id"] + SUBSYSTEMS].copy()
-    heat_melt = heat.melt(id_vars=["server_id"], var_name="subsystem", value_name="score")
-
-    fig = px.density_heatmap(
-        heat_melt,
-        x="subsystem",
-        y="server_id",
-        z="score",
+    # One partial sort serves both the heatmap and the offenders table below
+    offenders = fleet_df.nsmallest(max(top_n, 10), "overall_score")
+
+    # The score matrix goes to Plotly as-is: no melt, no client-side re-binning
+    heat = offenders.head(top_n)
+    fig = go.Figure(go.Heatmap(
+        z=heat[SUBSYSTEMS].to_numpy(dtype=np.float32),
+        x=SUBSYSTEMS,
+        y=heat["server_id"],
+        colorbar={"title": "score"},
+    ))
+    fig.update_layout(
         title=f"Subsystem Health Heatmap (Top {top_n} lowest overall scores)",
-        histfunc="avg"
+        xaxis_title="subsystem",
+        yaxis_title="server_id",
     )
     st.plotly_chart(fig, use_container_width=True)
 
     # Top offenders table
     st.subheader("Top Offenders (actionable triage list)")
-    offenders_table = fleet_df.sort_values("overall_score", ascending=True).head(10)[
+    offenders_table = offenders.head(10)[
         ["server_id", "overall_score", "temp_peak_c", "packet_loss_pct", "ecc_events", "cpu_peak_pct"]
     ]
     st.dataframe(offenders_table, use_container_width=True, hide_index=True)
@@ -561,8 +821,7 @@ if os.path.isfile(fleet_csv):
     pick = st.selectbox("Select server", list(fleet_df["server_id"].values))
     row = fleet_df[fleet_df["server_id"] == pick].iloc[0].to_dict()
     drill = _subsystem_summary(pick, injected, fleet_row=row)
-    styled = drill.style.applymap(_status_color, subset=["status"])
-    st.dataframe(styled, use_container_width=True, hide_index=True)
+    st.dataframe(_with_status_badges(drill), use_container_width=True, hide_index=True)
 
 else:
     st.info("Switch Mode → fleet and run validation to generate fleet heatmap + offenders list.")
@@ -572,7 +831,7 @@ st.divider()
 st.subheader("Generated Artifacts (audit trail)")
 
 if os.path.isdir(OUT_DIR):
-    files = sorted(os.listdir(OUT_DIR))
+    files = _list_artifacts(OUT_DIR, os.path.getmtime(OUT_DIR))
     if not files:
         st.info("No artifacts yet. Click **Run Bring-Up Validation**.")
     else:
@@ -581,9 +840,9 @@ if os.path.isdir(OUT_DIR):
         st.write(f"**{pick}**")
         try:
             if pick.endswith((".json", ".txt", ".log", ".md", ".yaml", ".yml", ".csv")):
-                with open(path, "r", encoding="utf-8", errors="ignore") as fp:
-                    content = fp.read()
-                st.code(content[:120000], language="json" if pick.endswith(".json") else None)
+                stat = os.stat(path)
+                content = _read_text(path, stat.st_mtime, stat.st_size)
+                st.code(content, language="json" if pick.endswith(".json") else None)
             else:
                 st.caption("Binary/other file type.")
         except Exception as e:
@@ -7,11 +7,19 @@ Orchestrates server bring-up validation workflows.
 import click
 import sys
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict
 
 from runner.test_orchestrator import TestOrchestrator
 from runner.config_loader import ConfigLoader
+from tests.status import Status
+
+
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
 
 
 def setup_logging(server_id: str, output_dir: Path) -> logging.Logger:
@@ -21,7 +29,7 @@ def setup_logging(server_id: str, output_dir: Path) -> logging.Logger:
     
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+        format=LOG_FORMAT,
         handlers=[
             logging.FileHandler(log_file),
             logging.StreamHandler(sys.stdout)
@@ -29,7 +37,7 @@ def setup_logging(server_id: str, output_dir: Path) -> logging.Logger:
     )
     
     logger = logging.getLogger("fleetbringup")
-    logger.info(f"Logging to {log_file}")
+    logger.info("Logging to %s", log_file)
     return logger
 
 
@@ -39,6 +47,21 @@ def cli():
     pass
 
 
+def _init_fleet_worker(log_queue) -> None:
+    """Route a worker process's logging through the parent's QueueListener."""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+
+
+def _run_one(server_id: str, test_plan: Dict[str, Any], output_dir: Path) -> str:
+    """Validate one server and return its overall status (module-level so it pickles)."""
+    logging.getLogger("fleetbringup").info("Validating %s", server_id)
+    orchestrator = TestOrchestrator(server_id, test_plan, output_dir)
+    results = orchestrator.run()
+    return results['overall_status']
+
+
 @cli.command()
 @click.option('--server-id', required=True, help='Server identifier (e.g., svr-12345)')
 @click.option('--config', required=True, type=click.Path(exists=True), help='Test plan YAML config')
@@ -50,8 +73,8 @@ def validate(server_id: str, config: str, output_dir: str):
     output_path.mkdir(exist_ok=True)
     
     logger = setup_logging(server_id, output_path)
-    logger.info(f"Starting validation for {server_id}")
-    logger.info(f"Test plan: {config}")
+    logger.info("Starting validation for %s", server_id)
+    logger.info("Test plan: %s", config)
     
     try:
         # Load test configuration
@@ -65,18 +88,18 @@ def validate(server_id: str, config: str, output_dir: str):
         results = orchestrator.run()
         
         # Report outcome
-        if results['overall_status'] == 'PASS':
-            logger.info(f"✓ Validation PASSED for {server_id}")
+        if results['overall_status'] == Status.PASS:
+            logger.info("✓ Validation PASSED for %s", server_id)
             sys.exit(0)
         else:
-            logger.error(f"✗ Validation FAILED for {server_id}")
+            logger.error("✗ Validation FAILED for %s", server_id)
             if 'failure_summary' in results:
-                logger.error(f"  Subsystem: {results['failure_summary']['subsystem']}")
-                logger.error(f"  Root cause: {results['failure_summary']['root_cause']}")
+                logger.error("  Subsystem: %s", results['failure_summary']['subsystem'])
+                logger.error("  Root cause: %s", results['failure_summary']['root_cause'])
             sys.exit(1)
             
     except Exception as e:
-        logger.exception(f"Validation failed with exception: {e}")
+        logger.exception("Validation failed with exception: %s", e)
         sys.exit(2)
 
 
@@ -85,7 +108,8 @@ def validate(server_id: str, config: str, output_dir: str):
               help='File containing server IDs (one per line)')
 @click.option('--config', required=True, type=click.Path(exists=True), help='Test plan YAML config')
 @click.option('--output-dir', default='reports', help='Output directory for results')
-def validate_fleet(server_list: str, config: str, output_dir: str):
+@click.option('--workers', type=int, default=None, help='Parallel worker processes (default: CPU count)')
+def validate_fleet(server_list: str, config: str, output_dir: str, workers: int):
     """Run validation suite on multiple servers (batch mode)."""
     
     output_path = Path(output_dir)
@@ -95,43 +119,66 @@ def validate_fleet(server_list: str, config: str, output_dir: str):
     with open(server_list, 'r') as f:
         servers = [line.strip() for line in f if line.strip()]
     
+    # Workers log through a queue; a single listener in this process owns the output handlers
+    # (stdout plus one shared fleet log file), so workers never block on file I/O and records
+    # from parallel servers never interleave mid-line.
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_file = output_path / f"fleet_{timestamp}.log"
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler(sys.stdout), logging.FileHandler(log_file)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    logging.basicConfig(level=logging.INFO, handlers=handlers)
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    
     logger = logging.getLogger("fleetbringup")
-    logger.info(f"Fleet validation: {len(servers)} servers")
+    logger.info("Logging to %s", log_file)
+    logger.info("Fleet validation: %s servers", len(servers))
+    
+    # Parse the test plan once; orchestrators only read it, so every server shares the same dict
+    try:
+        test_plan = ConfigLoader(config).load()
+    except Exception as e:
+        logger.exception("Failed to load test plan %s: %s", config, e)
+        listener.stop()
+        sys.exit(2)
     
     passed = 0
     failed = 0
     
-    for server_id in servers:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Validating {server_id}")
-        logger.info(f"{'='*60}")
-        
-        try:
-            config_loader = ConfigLoader(config)
-            test_plan = config_loader.load()
-            
-            orchestrator = TestOrchestrator(server_id, test_plan, output_path)
-            results = orchestrator.run()
+    # Servers are independent, so validate them in parallel worker processes
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_fleet_worker,
+                                 initargs=(log_queue,)) as executor:
+            futures = {executor.submit(_run_one, server_id, test_plan, output_path): server_id
+                       for server_id in servers}
             
-            if results['overall_status'] == 'PASS':
-                passed += 1
-                logger.info(f"✓ {server_id} PASSED")
-            else:
-                failed += 1
-                logger.error(f"✗ {server_id} FAILED")
-                
-        except Exception as e:
-            failed += 1
-            logger.exception(f"✗ {server_id} FAILED with exception: {e}")
+            for future in as_completed(futures):
+                server_id = futures[future]
+                try:
+                    if future.result() == Status.PASS:
+                        passed += 1
+                        logger.info("✓ %s PASSED", server_id)
+                    else:
+                        failed += 1
+                        logger.error("✗ %s FAILED", server_id)
+                        
+                except Exception as e:
+                    failed += 1
+                    logger.exception("✗ %s FAILED with exception: %s", server_id, e)
+    finally:
+        listener.stop()
     
     # Fleet summary
-    logger.info(f"\n{'='*60}")
-    logger.info(f"Fleet Validation Summary")
-    logger.info(f"{'='*60}")
-    logger.info(f"Total servers: {len(servers)}")
-    logger.info(f"Passed: {passed}")
-    logger.info(f"Failed: {failed}")
-    logger.info(f"Success rate: {100*passed/len(servers):.1f}%")
+    logger.info("\n%s", '=' * 60)
+    logger.info("Fleet Validation Summary")
+    logger.info("%s", '=' * 60)
+    logger.info("Total servers: %s", len(servers))
+    logger.info("Passed: %s", passed)
+    logger.info("Failed: %s", failed)
+    logger.info("Success rate: %.1f%%", 100 * passed / len(servers))
     
     sys.exit(0 if failed == 0 else 1)
 
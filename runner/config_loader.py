@@ -4,6 +4,9 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any
 
+# libyaml's C parser when PyYAML was built with it; same safe semantics, much faster parsing
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigLoader:
     """Loads and validates test plan configurations from YAML."""
@@ -15,15 +18,16 @@ class ConfigLoader:
     
     def load(self) -> Dict[str, Any]:
         """Load test plan from YAML file."""
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # Bytes in: the (C) reader detects the encoding and decodes itself, no Python text layer
+        with open(self.config_path, 'rb') as f:
+            config = yaml.load(f, Loader=_SafeLoader)
         
         self._validate(config)
         return config
     
     def _validate(self, config: Dict[str, Any]) -> None:
         """Validate config structure."""
-        if 'test_plan' not in config:
+        if not isinstance(config, dict) or 'test_plan' not in config:
             raise ValueError("Config must contain 'test_plan' key")
         
         test_plan = config['test_plan']
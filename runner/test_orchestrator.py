@@ -1,15 +1,23 @@
 """Core test orchestration and execution logic."""
 
 import logging
-import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Type
 
+import orjson
+
+from simulators.server_log import ServerLogAdapter
 from tests.cpu_stress import CPUStressTest
 from tests.memory_integrity import MemoryIntegrityTest
 from tests.network_connectivity import NetworkConnectivityTest
 from tests.thermal_power_sanity import ThermalPowerSanityTest
+from tests.status import Status
+
+_LOG = logging.getLogger("orchestrator")
 
 
 class TestOrchestrator:
@@ -26,57 +34,69 @@ class TestOrchestrator:
         self.server_id = server_id
         self.test_plan = test_plan
         self.output_dir = output_dir
-        self.logger = logging.getLogger(f"orchestrator.{server_id}")
+        self.logger = ServerLogAdapter(_LOG, server_id)
         
         self.results = {
             'server_id': server_id,
             'timestamp': datetime.now().isoformat(),
             'test_plan': test_plan['test_plan']['name'],
             'tests': [],
-            'overall_status': 'PASS'
+            'overall_status': Status.PASS
         }
+        
+        # Resolve test classes once; unknown names map to None and are reported as ERROR by run()
+        self._resolved = [
+            (test_config, self.TEST_REGISTRY.get(test_config['name']))
+            for test_config in test_plan['test_plan']['tests']
+        ]
     
     def run(self) -> Dict[str, Any]:
         """Execute all tests in the test plan."""
-        self.logger.info(f"Executing test plan: {self.test_plan['test_plan']['name']}")
+        self.logger.info("Executing test plan: %s", self.test_plan['test_plan']['name'])
         
-        tests = self.test_plan['test_plan']['tests']
+        # Tests are independent and mostly wait on simulated hardware, so they run concurrently;
+        # results are still collected in plan order, keeping the report and failure summary stable
+        with ThreadPoolExecutor(max_workers=max(1, len(self._resolved))) as executor:
+            futures = [
+                executor.submit(self._run_test, test_config['name'], test_class, test_config)
+                for test_config, test_class in self._resolved
+            ]
         
-        for test_config in tests:
+        for (test_config, _), future in zip(self._resolved, futures):
             test_name = test_config['name']
-            self.logger.info(f"Running test: {test_name}")
             
             try:
-                result = self._run_test(test_name, test_config)
+                result = future.result()
                 self.results['tests'].append(result)
                 
-                if result['status'] == 'FAIL':
-                    self.results['overall_status'] = 'FAIL'
+                if result['status'] == Status.FAIL:
+                    self.results['overall_status'] = Status.FAIL
                     self._build_failure_summary(result)
                     
             except Exception as e:
-                self.logger.exception(f"Test {test_name} raised exception: {e}")
+                self.logger.exception("Test %s raised exception: %s", test_name, e)
                 self.results['tests'].append({
                     'name': test_name,
-                    'status': 'ERROR',
+                    'status': Status.ERROR,
                     'error': str(e)
                 })
-                self.results['overall_status'] = 'FAIL'
+                self.results['overall_status'] = Status.FAIL
         
         self._write_results()
         return self.results
     
-    def _run_test(self, test_name: str, test_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _run_test(self, test_name: str, test_class: Optional[Type], test_config: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a single test."""
-        if test_name not in self.TEST_REGISTRY:
+        self.logger.info("Running test: %s", test_name)
+        if test_class is None:
             raise ValueError(f"Unknown test: {test_name}")
         
-        test_class = self.TEST_REGISTRY[test_name]
         test_instance = test_class(self.server_id, test_config)
         
-        start_time = datetime.now()
+        # Monotonic clock for the duration; wall-clock time is only for the report timestamp
+        start = time.perf_counter()
         result = test_instance.execute()
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start
         
         result['duration_sec'] = round(duration, 2)
         return result
@@ -90,11 +110,17 @@ class TestOrchestrator:
         }
     
     def _write_results(self) -> None:
-        """Write results to JSON file."""
+        """Write results to JSON file atomically (encode once, write a temp file, rename)."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = self.output_dir / f"{self.server_id}_{timestamp}_results.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        data = orjson.dumps(
+            self.results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+        tmp_file = output_file.with_suffix(".json.tmp")
+        tmp_file.write_bytes(data)
+        # Readers such as the dashboard never see a partially written report
+        os.replace(tmp_file, output_file)
         
-        self.logger.info(f"Results written to {output_file}")
+        self.logger.info("Results written to %s", output_file)
@@ -1,16 +1,31 @@
 """CPU hardware simulator for validation testing."""
 
-import random
 import logging
 from typing import Dict, Any
 
+from simulators.noise import NoiseBuffer
+from simulators.server_log import ServerLogAdapter
+
+# Half-widths of the uniform temperature (°C) and utilization noise, shared by every CPU
+_NOISE = NoiseBuffer((2.0, 0.05))
+
+_LOG = logging.getLogger("simulator.cpu")
+
 
 class CPUSimulator:
     """Simulates CPU telemetry and behavior."""
     
+    # Nominal load state (the clock returns to base_freq_ghz); __init__ and reset() both restore these
+    NOMINAL_STATE = {
+        'utilization': 0.0,
+        'temperature_c': 45.0,
+        'throttled': False,
+        'failure_injected': None,
+    }
+    
     def __init__(self, server_id: str):
         self.server_id = server_id
-        self.logger = logging.getLogger(f"simulator.cpu.{server_id}")
+        self.logger = ServerLogAdapter(_LOG, server_id)
         
         # Synthetic CPU config
         self.model = "Intel Xeon Platinum 8380"
@@ -18,19 +33,12 @@ class CPUSimulator:
         self.base_freq_ghz = 2.3
         self.max_freq_ghz = 3.4
         
-        # State
-        self.utilization = 0.0
-        self.current_freq_ghz = self.base_freq_ghz
-        self.temperature_c = 45.0
-        self.throttled = False
-        
-        self.failure_injected = None
+        self.reset()
     
     def get_status(self) -> Dict[str, Any]:
         """Get current CPU state and telemetry."""
         # Simulate some variance
-        temp_noise = random.uniform(-2.0, 2.0)
-        util_noise = random.uniform(-0.05, 0.05)
+        temp_noise, util_noise = _NOISE.draw()
         
         current_temp = self.temperature_c + temp_noise
         current_util = max(0.0, min(1.0, self.utilization + util_noise))
@@ -46,7 +54,7 @@ class CPUSimulator:
     
     def stress(self, duration_sec: int) -> None:
         """Simulate CPU stress workload."""
-        self.logger.info(f"CPU stress: {duration_sec}s")
+        self.logger.info("CPU stress: %ss", duration_sec)
         self.utilization = 0.95
         self.current_freq_ghz = self.max_freq_ghz
         self.temperature_c = 75.0  # Elevated under load
@@ -59,16 +67,15 @@ class CPUSimulator:
             self.throttled = True
             self.temperature_c = params.get('temp_c', 95.0)
             self.current_freq_ghz = self.base_freq_ghz * 0.6  # Throttled
-            self.logger.warning(f"Injected thermal throttle: {self.temperature_c}°C")
+            self.logger.warning("Injected thermal throttle: %s°C", self.temperature_c)
         
         elif failure_type == 'low_utilization':
             self.utilization = params.get('utilization', 0.3)
-            self.logger.warning(f"Injected low utilization: {self.utilization}")
+            self.logger.warning("Injected low utilization: %s", self.utilization)
     
     def reset(self) -> None:
         """Reset CPU to nominal state."""
-        self.utilization = 0.0
+        # setattr keeps the instance on the fast attribute path; touching __dict__ would not
+        for name, value in self.NOMINAL_STATE.items():
+            setattr(self, name, value)
         self.current_freq_ghz = self.base_freq_ghz
-        self.temperature_c = 45.0
-        self.throttled = False
-        self.failure_injected = None
@@ -4,25 +4,31 @@ import random
 import logging
 from typing import Dict, Any, List
 
+import numpy as np
+
+from simulators.server_log import ServerLogAdapter
+
+_LOG = logging.getLogger("simulator.memory")
+
 
 class MemorySimulator:
     """Simulates DIMM telemetry and ECC behavior."""
     
     def __init__(self, server_id: str):
         self.server_id = server_id
-        self.logger = logging.getLogger(f"simulator.memory.{server_id}")
+        self.logger = ServerLogAdapter(_LOG, server_id)
         
         # Synthetic memory config
         self.dimm_slots = 12
         self.dimm_capacity_gb = 32
         self.total_capacity_gb = self.dimm_slots * self.dimm_capacity_gb
         
-        # ECC error tracking
-        self.ecc_correctable_errors = {slot: 0 for slot in range(self.dimm_slots)}
-        self.ecc_uncorrectable_errors = {slot: 0 for slot in range(self.dimm_slots)}
+        # ECC error tracking, one array element per DIMM slot
+        self.ecc_correctable_errors = np.zeros(self.dimm_slots, dtype=np.int32)
+        self.ecc_uncorrectable_errors = np.zeros(self.dimm_slots, dtype=np.int32)
         
         # Temperature per DIMM
-        self.dimm_temps_c = {slot: 55.0 for slot in range(self.dimm_slots)}
+        self.dimm_temps_c = np.full(self.dimm_slots, 55.0)
         
         self.failure_injected = None
     
@@ -31,9 +37,9 @@ class MemorySimulator:
         return {
             'total_capacity_gb': self.total_capacity_gb,
             'dimm_slots': self.dimm_slots,
-            'ecc_correctable_errors': dict(self.ecc_correctable_errors),
-            'ecc_uncorrectable_errors': dict(self.ecc_uncorrectable_errors),
-            'dimm_temperatures_c': {k: round(v, 1) for k, v in self.dimm_temps_c.items()}
+            'ecc_correctable_errors': dict(enumerate(self.ecc_correctable_errors.tolist())),
+            'ecc_uncorrectable_errors': dict(enumerate(self.ecc_uncorrectable_errors.tolist())),
+            'dimm_temperatures_c': dict(enumerate(np.round(self.dimm_temps_c, 1).tolist()))
         }
     
     def run_integrity_check(self) -> bool:
@@ -50,30 +56,37 @@ class MemorySimulator:
         # Nominal case: pass
         return True
     
+    def _checked_slot(self, slot: int) -> int:
+        """Reject slots outside the DIMM array (a negative index would silently wrap to a real DIMM)."""
+        if not 0 <= slot < self.dimm_slots:
+            raise ValueError(f"DIMM slot {slot} out of range (0-{self.dimm_slots - 1})")
+        return slot
+    
     def inject_failure(self, failure_type: str, **params) -> None:
-        """Inject controlled memory failure."""
-        self.failure_injected = failure_type
-        
+        """Inject controlled memory failure (an out-of-range slot raises ValueError and changes nothing)."""
         if failure_type == 'ecc_correctable':
-            slot = params.get('slot', 3)
+            slot = self._checked_slot(params.get('slot', 3))
             error_count = params.get('error_count', 15)
             self.ecc_correctable_errors[slot] = error_count
-            self.logger.warning(f"Injected ECC correctable errors: slot {slot}, count {error_count}")
+            self.logger.warning("Injected ECC correctable errors: slot %s, count %s", slot, error_count)
         
         elif failure_type == 'ecc_uncorrectable':
-            slot = params.get('slot', 7)
+            slot = self._checked_slot(params.get('slot', 7))
             self.ecc_uncorrectable_errors[slot] = 1
-            self.logger.error(f"Injected ECC uncorrectable error: slot {slot}")
+            self.logger.error("Injected ECC uncorrectable error: slot %s", slot)
         
         elif failure_type == 'overheat':
-            slot = params.get('slot', 5)
+            slot = self._checked_slot(params.get('slot', 5))
             temp = params.get('temp_c', 85.0)
             self.dimm_temps_c[slot] = temp
-            self.logger.warning(f"Injected DIMM overheat: slot {slot}, {temp}°C")
+            self.logger.warning("Injected DIMM overheat: slot %s, %s°C", slot, temp)
+        
+        # Recorded only once the state change has been applied
+        self.failure_injected = failure_type
     
     def reset(self) -> None:
         """Reset memory to nominal state."""
-        self.ecc_correctable_errors = {slot: 0 for slot in range(self.dimm_slots)}
-        self.ecc_uncorrectable_errors = {slot: 0 for slot in range(self.dimm_slots)}
-        self.dimm_temps_c = {slot: 55.0 for slot in range(self.dimm_slots)}
+        self.ecc_correctable_errors.fill(0)
+        self.ecc_uncorrectable_errors.fill(0)
+        self.dimm_temps_c.fill(55.0)
         self.failure_injected = None
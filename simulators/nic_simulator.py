@@ -2,27 +2,39 @@
 
 import random
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from simulators.server_log import ServerLogAdapter
+
+_LOG = logging.getLogger("simulator.nic")
 
 
 class NICSimulator:
     """Simulates NIC telemetry and link behavior."""
     
-    def __init__(self, server_id: str):
+    # Nominal link state; __init__ and reset() both restore these
+    NOMINAL_STATE = {
+        'link_up': True,
+        'packet_loss_rate': 0.0,
+        'current_bandwidth_gbps': 0.0,
+        'failure_injected': None,
+    }
+    
+    def __init__(self, server_id: str, mac_address: Optional[str] = None):
         self.server_id = server_id
-        self.logger = logging.getLogger(f"simulator.nic.{server_id}")
+        self.logger = ServerLogAdapter(_LOG, server_id)
         
         # Synthetic NIC config
         self.interface_name = "eth0"
         self.link_speed_gbps = 25
-        self.mac_address = f"00:1a:2b:{random.randint(0,255):02x}:{random.randint(0,255):02x}:{random.randint(0,255):02x}"
-        
-        # State
-        self.link_up = True
-        self.packet_loss_rate = 0.0
-        self.current_bandwidth_gbps = 0.0
+        # Callers building many simulators can pass pre-generated MACs; otherwise draw the
+        # 24-bit device part in one call
+        if mac_address is None:
+            suffix = random.getrandbits(24)
+            mac_address = f"00:1a:2b:{suffix >> 16:02x}:{(suffix >> 8) & 0xff:02x}:{suffix & 0xff:02x}"
+        self.mac_address = mac_address
         
-        self.failure_injected = None
+        self.reset()
     
     def get_status(self) -> Dict[str, Any]:
         """Get current NIC state and telemetry."""
@@ -37,7 +49,7 @@ class NICSimulator:
     
     def test_connectivity(self, target_bandwidth_gbps: float, duration_sec: int) -> bool:
         """Simulate network connectivity test (e.g., iperf3)."""
-        self.logger.info(f"Testing connectivity: target {target_bandwidth_gbps} Gbps, duration {duration_sec}s")
+        self.logger.info("Testing connectivity: target %s Gbps, duration %ss", target_bandwidth_gbps, duration_sec)
         
         if not self.link_up:
             self.logger.error("Link down, connectivity test failed")
@@ -51,7 +63,7 @@ class NICSimulator:
         success = achieved_bandwidth >= target_bandwidth_gbps * 0.9
         
         if not success:
-            self.logger.error(f"Bandwidth test failed: {achieved_bandwidth:.2f} < {target_bandwidth_gbps * 0.9:.2f} Gbps")
+            self.logger.error("Bandwidth test failed: %.2f < %.2f Gbps", achieved_bandwidth, target_bandwidth_gbps * 0.9)
         
         return success
     
@@ -66,16 +78,14 @@ class NICSimulator:
         elif failure_type == 'packet_loss':
             loss_rate = params.get('loss_rate', 0.05)
             self.packet_loss_rate = loss_rate
-            self.logger.warning(f"Injected packet loss: {loss_rate * 100:.2f}%")
+            self.logger.warning("Injected packet loss: %.2f%%", loss_rate * 100)
         
         elif failure_type == 'degraded_bandwidth':
             degradation = params.get('degradation', 0.5)
             self.current_bandwidth_gbps = self.link_speed_gbps * degradation
-            self.logger.warning(f"Injected bandwidth degradation: {self.current_bandwidth_gbps:.2f} Gbps")
+            self.logger.warning("Injected bandwidth degradation: %.2f Gbps", self.current_bandwidth_gbps)
     
     def reset(self) -> None:
         """Reset NIC to nominal state."""
-        self.link_up = True
-        self.packet_loss_rate = 0.0
-        self.current_bandwidth_gbps = 0.0
-        self.failure_injected = None
+        for name, value in self.NOMINAL_STATE.items():
+            setattr(self, name, value)
@@ -0,0 +1,55 @@
+"""Telemetry noise shared by the simulators."""
+
+import os
+import weakref
+from typing import Sequence, Tuple
+
+import numpy as np
+
+# Samples drawn per refill; one refill serves this many readings
+NOISE_CHUNK = 4096
+
+_BUFFERS = weakref.WeakSet()
+
+
+class NoiseBuffer:
+    """
+    Uniform noise in [-scale, scale] for each component, drawn from NumPy in blocks and
+    handed out one tuple per reading. One buffer is shared by every simulator instance of a
+    kind, so constructing a simulator costs nothing and a reading is a single list-iterator
+    step (atomic under the GIL, so concurrent tests can share it).
+    """
+    
+    def __init__(self, scale: Sequence[float]):
+        self._scale = np.asarray(scale, dtype=float)
+        self._rng = None
+        self._samples = iter(())
+        _BUFFERS.add(self)
+    
+    def draw(self) -> Tuple[float, ...]:
+        """Return the next noise tuple, refilling the block when it runs out."""
+        try:
+            return next(self._samples)
+        except StopIteration:
+            self._refill()
+            return next(self._samples)
+    
+    def _refill(self) -> None:
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        block = self._rng.uniform(-1.0, 1.0, (NOISE_CHUNK, self._scale.size)) * self._scale
+        self._samples = iter(block.tolist())
+    
+    def _reset(self) -> None:
+        self._rng = None
+        self._samples = iter(())
+
+
+def _reset_after_fork() -> None:
+    # Forked fleet workers would otherwise replay the parent's generator state and buffer
+    for buffer in list(_BUFFERS):
+        buffer._reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,14 @@
+"""Per-server logging on top of one shared logger per component."""
+
+import logging
+
+
+class ServerLogAdapter(logging.LoggerAdapter):
+    """Tags each record with the server id, so components don't need a logger per server."""
+    
+    def __init__(self, logger: logging.Logger, server_id: str):
+        super().__init__(logger, {'server_id': server_id})
+    
+    def process(self, msg, kwargs):
+        # Only reached for records that pass the level check
+        return f"[{self.extra['server_id']}] {msg}", kwargs
@@ -1,112 +1,135 @@
 """Thermal and power subsystem simulator for validation testing."""
 
-import random
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+from simulators.noise import NoiseBuffer
+from simulators.server_log import ServerLogAdapter
+
+# Half-widths of the uniform noise on the CPU temp (°C), DIMM temp (°C) and power (W) readings
+_NOISE = NoiseBuffer((1.0, 1.0, 10.0))
+
+_LOG = logging.getLogger("simulator.thermal_power")
 
 
 class ThermalPowerSimulator:
     """Simulates thermal zones, power draw, and fan control."""
     
+    # Nominal thermal zones, power draw and fan speed; __init__ and reset() both restore these
+    NOMINAL_STATE = {
+        'cpu_temp_c': 50.0,
+        'dimm_temp_c': 55.0,
+        'inlet_temp_c': 25.0,
+        'exhaust_temp_c': 35.0,
+        'power_draw_w': 350.0,
+        'fan_rpm': 5000,
+        'failure_injected': None,
+    }
+    
     def __init__(self, server_id: str):
         self.server_id = server_id
-        self.logger = logging.getLogger(f"simulator.thermal_power.{server_id}")
-        
-        # Thermal zones
-        self.cpu_temp_c = 50.0
-        self.dimm_temp_c = 55.0
-        self.inlet_temp_c = 25.0
-        self.exhaust_temp_c = 35.0
+        self.logger = ServerLogAdapter(_LOG, server_id)
         
-        # Power
-        self.power_draw_w = 350.0
+        # Static power and fan limits
         self.max_power_w = 1200.0
-        
-        # Fans
-        self.fan_rpm = 5000
         self.fan_max_rpm = 15000
         
-        self.failure_injected = None
+        self.reset()
     
     def get_status(self) -> Dict[str, Any]:
         """Get current thermal and power telemetry."""
         # Add noise
-        cpu_temp = self.cpu_temp_c + random.uniform(-1.0, 1.0)
-        dimm_temp = self.dimm_temp_c + random.uniform(-1.0, 1.0)
-        power = self.power_draw_w + random.uniform(-10.0, 10.0)
+        cpu_noise, dimm_noise, power_noise = _NOISE.draw()
+        cpu_temp = round(self.cpu_temp_c + cpu_noise, 1)
+        dimm_temp = round(self.dimm_temp_c + dimm_noise, 1)
+        power = round(self.power_draw_w + power_noise, 1)
         
         return {
             'temperatures_c': {
-                'cpu': round(cpu_temp, 1),
-                'dimm': round(dimm_temp, 1),
+                'cpu': cpu_temp,
+                'dimm': dimm_temp,
                 'inlet': round(self.inlet_temp_c, 1),
                 'exhaust': round(self.exhaust_temp_c, 1)
             },
-            'power_draw_w': round(power, 1),
+            'power_draw_w': power,
             'max_power_w': self.max_power_w,
             'fan_rpm': self.fan_rpm,
             'fan_max_rpm': self.fan_max_rpm
         }
     
-    def check_thermal_sanity(self, max_cpu_temp_c: float, max_dimm_temp_c: float) -> bool:
-        """Validate thermal readings are within acceptable thresholds."""
-        self.logger.info(f"Thermal sanity check: CPU < {max_cpu_temp_c}°C, DIMM < {max_dimm_temp_c}°C")
-        
-        status = self.get_status()
+    def check_thermal_sanity(self, max_cpu_temp_c: float, max_dimm_temp_c: float,
+                             status: Optional[Dict[str, Any]] = None
+                             ) -> Tuple[bool, Optional[str], Optional[float]]:
+        """
+        Validate thermal readings are within acceptable thresholds (a fresh reading unless status is given).
+        Returns (ok, zone, temp_c): the first zone over its limit ('cpu' or 'dimm') and its reading,
+        or (True, None, None).
+        """
+        self.logger.info("Thermal sanity check: CPU < %s°C, DIMM < %s°C", max_cpu_temp_c, max_dimm_temp_c)
+        
+        if status is None:
+            status = self.get_status()
         temps = status['temperatures_c']
         
         if temps['cpu'] > max_cpu_temp_c:
-            self.logger.error(f"CPU temp out of range: {temps['cpu']}°C > {max_cpu_temp_c}°C")
-            return False
+            self.logger.error("CPU temp out of range: %s°C > %s°C", temps['cpu'], max_cpu_temp_c)
+            return False, 'cpu', temps['cpu']
         
         if temps['dimm'] > max_dimm_temp_c:
-            self.logger.error(f"DIMM temp out of range: {temps['dimm']}°C > {max_dimm_temp_c}°C")
-            return False
+            self.logger.error("DIMM temp out of range: %s°C > %s°C", temps['dimm'], max_dimm_temp_c)
+            return False, 'dimm', temps['dimm']
         
-        return True
+        return True, None, None
     
-    def check_power_sanity(self, expected_idle_w: float, tolerance: float = 0.2) -> bool:
-        """Validate power draw is within expected range."""
-        self.logger.info(f"Power sanity check: expected ~{expected_idle_w}W ± {tolerance*100}%")
-        
-        status = self.get_status()
+    def check_power_sanity(self, bounds: Tuple[float, float],
+                           status: Optional[Dict[str, Any]] = None) -> bool:
+        """Validate power draw is within the (lower, upper) window in watts (a fresh reading unless status is given)."""
+        lower_bound, upper_bound = bounds
+        self.logger.info("Power sanity check: expected %.1fW to %.1fW", lower_bound, upper_bound)
+        
+        if status is None:
+            status = self.get_status()
         power = status['power_draw_w']
         
-        lower_bound = expected_idle_w * (1 - tolerance)
-        upper_bound = expected_idle_w * (1 + tolerance)
-        
         if power < lower_bound or power > upper_bound:
-            self.logger.error(f"Power draw out of range: {power}W not in [{lower_bound}, {upper_bound}]")
+            self.logger.error("Power draw out of range: %sW not in [%.1f, %.1f]", power, lower_bound, upper_bound)
             return False
         
         return True
     
+    def _inject_cpu_overheat(self, params: Dict[str, Any]) -> None:
+        self.cpu_temp_c = params.get('temp_c', 95.0)
+        self.logger.warning("Injected CPU overheat: %s°C", self.cpu_temp_c)
+    
+    def _inject_dimm_overheat(self, params: Dict[str, Any]) -> None:
+        self.dimm_temp_c = params.get('temp_c', 85.0)
+        self.logger.warning("Injected DIMM overheat: %s°C", self.dimm_temp_c)
+    
+    def _inject_power_spike(self, params: Dict[str, Any]) -> None:
+        self.power_draw_w = params.get('power_w', 900.0)
+        self.logger.warning("Injected power spike: %sW", self.power_draw_w)
+    
+    def _inject_fan_failure(self, params: Dict[str, Any]) -> None:
+        self.fan_rpm = 0
+        self.logger.error("Injected fan failure")
+    
+    FAILURE_HANDLERS = {
+        'cpu_overheat': _inject_cpu_overheat,
+        'dimm_overheat': _inject_dimm_overheat,
+        'power_spike': _inject_power_spike,
+        'fan_failure': _inject_fan_failure,
+    }
+    
     def inject_failure(self, failure_type: str, **params) -> None:
         """Inject controlled thermal/power failure."""
         self.failure_injected = failure_type
         
-        if failure_type == 'cpu_overheat':
-            self.cpu_temp_c = params.get('temp_c', 95.0)
-            self.logger.warning(f"Injected CPU overheat: {self.cpu_temp_c}°C")
-        
-        elif failure_type == 'dimm_overheat':
-            self.dimm_temp_c = params.get('temp_c', 85.0)
-            self.logger.warning(f"Injected DIMM overheat: {self.dimm_temp_c}°C")
-        
-        elif failure_type == 'power_spike':
-            self.power_draw_w = params.get('power_w', 900.0)
-            self.logger.warning(f"Injected power spike: {self.power_draw_w}W")
-        
-        elif failure_type == 'fan_failure':
-            self.fan_rpm = 0
-            self.logger.error("Injected fan failure")
+        # Unknown types are recorded but change no readings
+        handler = self.FAILURE_HANDLERS.get(failure_type)
+        if handler is not None:
+            handler(self, params)
     
     def reset(self) -> None:
         """Reset to nominal state."""
-        self.cpu_temp_c = 50.0
-        self.dimm_temp_c = 55.0
-        self.inlet_temp_c = 25.0
-        self.exhaust_temp_c = 35.0
-        self.power_draw_w = 350.0
-        self.fan_rpm = 5000
-        self.failure_injected = None
+        for name, value in self.NOMINAL_STATE.items():
+            setattr(self, name, value)
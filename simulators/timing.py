@@ -0,0 +1,14 @@
+"""Simulated test latency shared by the validation tests."""
+
+import os
+import time
+
+# Multiplier applied to every simulated test delay; FLEET_FAST_MODE=1 turns them all off
+SIMULATED_SLEEP_SCALE = 0.0 if os.environ.get('FLEET_FAST_MODE') == '1' else 1.0
+
+
+def simulate_delay(seconds: float, fast_mode: bool = False) -> None:
+    """Stand in for real hardware test time; skipped in fast mode."""
+    if fast_mode or SIMULATED_SLEEP_SCALE <= 0:
+        return
+    time.sleep(seconds * SIMULATED_SLEEP_SCALE)
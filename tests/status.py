@@ -0,0 +1,16 @@
+"""Result status shared by the validation tests and the orchestrator."""
+
+from enum import Enum
+
+
+class Status(str, Enum):
+    """Test / run outcome; a str subclass, so it compares equal to and serializes as its name."""
+    
+    PASS = 'PASS'
+    FAIL = 'FAIL'
+    ERROR = 'ERROR'
+    
+    def __str__(self) -> str:
+        return self.value
+    
+    __format__ = str.__format__
@@ -0,0 +1,35 @@
+"""Unit tests for MemorySimulator failure injection."""
+
+import unittest
+
+from simulators.memory_simulator import MemorySimulator
+
+
+class InjectFailureSlotTest(unittest.TestCase):
+    """Slot validation in MemorySimulator.inject_failure."""
+
+    def setUp(self):
+        self.memory = MemorySimulator('srv-test')
+
+    def test_out_of_range_slot_is_rejected_without_side_effects(self):
+        for failure_type in ('ecc_correctable', 'ecc_uncorrectable', 'overheat'):
+            for slot in (self.memory.dimm_slots, -1):
+                with self.subTest(failure_type=failure_type, slot=slot):
+                    with self.assertRaises(ValueError):
+                        self.memory.inject_failure(failure_type, slot=slot)
+
+                    self.assertIsNone(self.memory.failure_injected)
+                    status = self.memory.get_status()
+                    self.assertFalse(any(status['ecc_correctable_errors'].values()))
+                    self.assertFalse(any(status['ecc_uncorrectable_errors'].values()))
+                    self.assertEqual(set(status['dimm_temperatures_c'].values()), {55.0})
+
+    def test_valid_slot_is_injected_and_recorded(self):
+        self.memory.inject_failure('ecc_correctable', slot=0, error_count=15)
+
+        self.assertEqual(self.memory.failure_injected, 'ecc_correctable')
+        self.assertEqual(self.memory.get_status()['ecc_correctable_errors'][0], 15)
+
+
+if __name__ == '__main__':
+    unittest.main()